@@ -4,24 +4,50 @@ Ejemplos básicos de Python con GitHub Copilot
 Demuestra cómo escribir prompts efectivos para generar código Python
 """
 
+import aiohttp
 import asyncio
 import json
-import math
 import re
-import requests
+import numpy as np
+import orjson
+from collections import Counter
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
 from pathlib import Path
 
 
-@dataclass
+# Patrones regex precompilados (se reutilizan en cada llamada)
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_WORD_RE = re.compile(r'\b\w+\b')
+_SENTENCE_RE = re.compile(r'[.!?]+')
+_NON_ALNUM_RE = re.compile(r'[^a-zA-Z0-9]')
+
+# Saltos entre candidatos coprimos con 2, 3 y 5 empezando en 7 (7, 11, 13, 17, ...)
+_WHEEL_INCREMENTS = (4, 2, 4, 2, 4, 6, 2, 6)
+
+# Año actual cacheado para no llamar a datetime.now() en cada acceso
+_CURRENT_YEAR = datetime.now().year
+
+
+def refresh_year() -> int:
+    """Actualiza el año cacheado (útil en procesos de larga duración)"""
+    global _CURRENT_YEAR
+    _CURRENT_YEAR = datetime.now().year
+    return _CURRENT_YEAR
+
+
+@dataclass(frozen=True)
 class Person:
     """
     Clase Person generada con GitHub Copilot
     Prompt: Clase que representa una persona con nombre, edad y email
     Debe validar el email y calcular el año de nacimiento
+    Inmutable y con __slots__ para evitar un __dict__ por instancia
     """
+    __slots__ = ('name', 'age', 'email')
+    
     name: str
     age: int
     email: str
@@ -33,16 +59,24 @@ class Person:
         if self.age < 0 or self.age > 150:
             raise ValueError(f"Edad inválida: {self.age}")
     
+    def __getstate__(self) -> Tuple[any, ...]:
+        """Estado para pickle/copy (sin __dict__ por usar __slots__)"""
+        return tuple(getattr(self, name) for name in self.__slots__)
+    
+    def __setstate__(self, state: Tuple[any, ...]) -> None:
+        """Restaura el estado saltándose el __setattr__ congelado"""
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+    
     @staticmethod
     def is_valid_email(email: str) -> bool:
         """Valida formato de email usando regex"""
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(pattern, email) is not None
+        return _EMAIL_RE.match(email) is not None
     
     @property
     def birth_year(self) -> int:
         """Calcula el año de nacimiento aproximado"""
-        return datetime.now().year - self.age
+        return _CURRENT_YEAR - self.age
     
     def to_dict(self) -> Dict[str, any]:
         """Convierte la instancia a diccionario"""
@@ -52,6 +86,41 @@ class Person:
             'email': self.email,
             'birth_year': self.birth_year
         }
+    
+    @classmethod
+    def to_dicts(cls, people: List['Person']) -> List[Dict[str, any]]:
+        """Convierte un lote de personas a diccionarios"""
+        return [person.to_dict() for person in people]
+
+
+class PersonBatch:
+    """
+    Prompt: Clase que guarda muchas personas en columnas (structure of arrays)
+    Las edades se guardan en un array NumPy para operar sobre todas a la vez
+    """
+    
+    def __init__(self, names: List[str], ages: np.ndarray, emails: List[str]):
+        if not (len(names) == len(ages) == len(emails)):
+            raise ValueError("names, ages y emails deben tener la misma longitud")
+        self.names = names
+        self.ages = np.asarray(ages, dtype=np.int16)
+        self.emails = emails
+    
+    @classmethod
+    def from_people(cls, people: List[Person]) -> 'PersonBatch':
+        """Construye el lote a partir de instancias Person ya validadas"""
+        return cls(
+            [person.name for person in people],
+            np.fromiter((person.age for person in people), dtype=np.int16, count=len(people)),
+            [person.email for person in people]
+        )
+    
+    def __len__(self) -> int:
+        return len(self.names)
+    
+    def birth_years(self) -> np.ndarray:
+        """Calcula todos los años de nacimiento con una sola operación vectorizada"""
+        return _CURRENT_YEAR - self.ages.astype(np.int32)
 
 
 class DataProcessor:
@@ -59,55 +128,81 @@ class DataProcessor:
     Clase para procesamiento de datos generada con Copilot
     Prompt: Clase que procesa listas de números y texto
     Debe incluir métodos para estadísticas, filtrado y transformación
+    Usar add_data para añadir elementos (o reasignar data completo): modificar
+    la lista data directamente no actualiza las vistas por tipo
     """
     
     def __init__(self, data: List[any] = None):
-        self.data = data or []
+        # Copia propia de los datos para no depender de la lista del llamador
+        self.data = list(data) if data else []
+    
+    @property
+    def data(self) -> List[any]:
+        """Lista de datos"""
+        return self._data
+    
+    @data.setter
+    def data(self, data: List[any]) -> None:
+        # Vistas por tipo mantenidas al insertar, así los filtros no recorren self.data
+        self._data = data
+        self._numbers: List[float] = []
+        self._strings: List[str] = []
+        for item in data:
+            self._index_item(item)
+    
+    def _index_item(self, item: any) -> None:
+        """Clasifica un elemento en la vista de números o de strings"""
+        if isinstance(item, (int, float)):
+            self._numbers.append(item)
+        elif isinstance(item, str):
+            self._strings.append(item)
     
     def add_data(self, item: any) -> None:
         """Añade un elemento a los datos"""
-        self.data.append(item)
+        self._data.append(item)
+        self._index_item(item)
     
     def filter_numbers(self) -> List[float]:
         """Filtra solo los números de los datos"""
-        return [item for item in self.data if isinstance(item, (int, float))]
+        return list(self._numbers)
     
     def filter_strings(self) -> List[str]:
         """Filtra solo las strings de los datos"""
-        return [item for item in self.data if isinstance(item, str)]
+        return list(self._strings)
     
     def get_statistics(self) -> Dict[str, float]:
         """Calcula estadísticas básicas de los números"""
-        numbers = self.filter_numbers()
+        numbers = self._numbers
         if not numbers:
             return {'count': 0, 'sum': 0, 'mean': 0, 'min': 0, 'max': 0, 'std': 0}
         
+        # count/sum/min/max se calculan sobre los valores originales (conservan int y precisión);
+        # solo la desviación estándar usa un array para evitar la pasada en Python
         count = len(numbers)
         total = sum(numbers)
-        mean = total / count
-        variance = sum((x - mean) ** 2 for x in numbers) / count
-        std = math.sqrt(variance)
+        arr = np.fromiter(numbers, dtype=np.float64, count=count)
         
         return {
             'count': count,
             'sum': total,
-            'mean': mean,
+            'mean': total / count,
             'min': min(numbers),
             'max': max(numbers),
-            'std': std
+            'std': float(arr.std())
         }
     
-    def word_frequency(self) -> Dict[str, int]:
-        """Calcula la frecuencia de palabras en las strings"""
-        strings = self.filter_strings()
-        word_count = {}
-        
-        for text in strings:
-            words = re.findall(r'\b\w+\b', text.lower())
-            for word in words:
-                word_count[word] = word_count.get(word, 0) + 1
+    def word_frequency(self, k: Optional[int] = None) -> Dict[str, int]:
+        """
+        Calcula la frecuencia de palabras en las strings
+        Si se indica k, solo retorna las k palabras más frecuentes
+        """
+        # Unir todos los textos y pasar la regex una sola vez
+        # (el separador '\n' no forma parte de \w, así que no une palabras)
+        all_text = '\n'.join(self._strings).lower()
+        word_count = Counter(_WORD_RE.findall(all_text))
         
-        return dict(sorted(word_count.items(), key=lambda x: x[1], reverse=True))
+        # most_common(k) usa heapq.nlargest: O(N log k) en lugar de ordenar todo
+        return dict(word_count.most_common(k))
 
 
 def fibonacci_sequence(n: int) -> List[int]:
@@ -115,19 +210,30 @@ def fibonacci_sequence(n: int) -> List[int]:
     Prompt: Función que genera la secuencia de Fibonacci hasta n términos
     Debe manejar casos edge como n <= 0 y ser eficiente
     """
+    # Se retorna una lista nueva para que el llamador no modifique la caché
+    return list(_fibonacci_cached(n))
+
+
+@lru_cache(maxsize=1024)
+def _fibonacci_cached(n: int) -> Tuple[int, ...]:
+    """Calcula la secuencia de Fibonacci y la memoriza como tupla inmutable"""
     if n <= 0:
-        return []
+        return ()
     elif n == 1:
-        return [0]
+        return (0,)
     elif n == 2:
-        return [0, 1]
+        return (0, 1)
     
+    # Par móvil (a, b) en lugar de indexar la lista en cada iteración;
+    # append se enlaza a una variable local para evitar buscar el atributo
     sequence = [0, 1]
-    for i in range(2, n):
-        next_num = sequence[i-1] + sequence[i-2]
-        sequence.append(next_num)
+    append = sequence.append
+    a, b = 0, 1
+    for _ in range(2, n):
+        a, b = b, a + b
+        append(b)
     
-    return sequence
+    return tuple(sequence)
 
 
 def is_palindrome(text: str) -> bool:
@@ -136,7 +242,7 @@ def is_palindrome(text: str) -> bool:
     Debe ignorar espacios, puntuación y mayúsculas
     """
     # Limpiar el texto: solo letras y números, convertir a minúsculas
-    cleaned = re.sub(r'[^a-zA-Z0-9]', '', text.lower())
+    cleaned = _NON_ALNUM_RE.sub('', text.lower())
     return cleaned == cleaned[::-1]
 
 
@@ -145,52 +251,91 @@ def prime_factors(n: int) -> List[int]:
     Prompt: Función que encuentra los factores primos de un número
     Debe ser eficiente y manejar números grandes
     """
+    return list(_prime_factors_cached(n))
+
+
+@lru_cache(maxsize=1024)
+def _prime_factors_cached(n: int) -> Tuple[int, ...]:
+    """Factoriza n y memoriza el resultado como tupla inmutable"""
     if n <= 1:
-        return []
+        return ()
     
     factors = []
-    d = 2
     
+    # Dividir primero por 2, 3 y 5 explícitamente
+    for d in (2, 3, 5):
+        while n % d == 0:
+            factors.append(d)
+            n //= d
+    
+    # Rueda 2-3-5: a partir de 7 solo se prueban candidatos coprimos con 30
+    d = 7
+    i = 0
     while d * d <= n:
         while n % d == 0:
             factors.append(d)
             n //= d
-        d += 1
+        d += _WHEEL_INCREMENTS[i]
+        i = (i + 1) % 8
     
     if n > 1:
         factors.append(n)
     
-    return factors
+    return tuple(factors)
 
 
-async def fetch_url_async(url: str, timeout: int = 10) -> Dict[str, any]:
+async def fetch_url_async(url: str, timeout: int = 10,
+                          session: Optional[aiohttp.ClientSession] = None,
+                          fetch_metadata_only: bool = False) -> Dict[str, any]:
     """
     Prompt: Función async que hace petición HTTP y retorna información
     Debe manejar timeouts, errores HTTP y parsear JSON si es posible
+    Acepta una sesión aiohttp compartida para lanzar varias peticiones concurrentes
+    Con fetch_metadata_only=True hace HEAD y no descarga el cuerpo
     """
+    if session is None:
+        # Sin sesión compartida se abre una temporal solo para esta petición
+        async with aiohttp.ClientSession() as own_session:
+            return await fetch_url_async(url, timeout, own_session, fetch_metadata_only)
+    
+    client_timeout = aiohttp.ClientTimeout(total=timeout)
     try:
-        response = requests.get(url, timeout=timeout)
-        response.raise_for_status()
+        if fetch_metadata_only:
+            # Solo estado y cabeceras: el tamaño sale de Content-Length (None si no viene)
+            async with session.head(url, timeout=client_timeout, allow_redirects=True) as response:
+                response.raise_for_status()
+                return {
+                    'url': url,
+                    'status_code': response.status,
+                    'headers': dict(response.headers),
+                    'content_length': response.content_length,
+                    'timestamp': datetime.now().isoformat()
+                }
         
-        result = {
-            'url': url,
-            'status_code': response.status_code,
-            'headers': dict(response.headers),
-            'content_length': len(response.content),
-            'timestamp': datetime.now().isoformat()
-        }
-        
-        # Intentar parsear JSON
-        try:
-            result['json_data'] = response.json()
-        except json.JSONDecodeError:
-            result['text_preview'] = response.text[:200] + '...' if len(response.text) > 200 else response.text
+        async with session.get(url, timeout=client_timeout) as response:
+            response.raise_for_status()
+            content = await response.read()
+            
+            result = {
+                'url': url,
+                'status_code': response.status,
+                'headers': dict(response.headers),
+                'content_length': len(content),
+                'timestamp': datetime.now().isoformat()
+            }
+            
+            # Intentar parsear JSON sobre el cuerpo ya leído (binario o no UTF-8 cae a la vista previa)
+            try:
+                result['json_data'] = json.loads(content)
+            except (ValueError, UnicodeDecodeError):
+                text = content.decode(response.get_encoding(), errors='replace')
+                result['text_preview'] = text[:200] + '...' if len(text) > 200 else text
+            
+            return result
         
-        return result
-        
-    except requests.exceptions.Timeout:
+    except asyncio.TimeoutError:
         return {'error': 'Timeout', 'url': url}
-    except requests.exceptions.RequestException as e:
+    except aiohttp.ClientError as e:
         return {'error': str(e), 'url': url}
 
 
@@ -204,23 +349,19 @@ def analyze_text(text: str) -> Dict[str, any]:
     
     # Estadísticas básicas
     char_count = len(text)
-    word_count = len(re.findall(r'\b\w+\b', text))
-    sentence_count = len(re.findall(r'[.!?]+', text))
-    paragraph_count = len([p for p in text.split('\n\n') if p.strip()])
-    
-    # Frecuencia de letras
-    letter_freq = {}
-    for char in text.lower():
-        if char.isalpha():
-            letter_freq[char] = letter_freq.get(char, 0) + 1
+    words = _WORD_RE.findall(text)
+    word_count = len(words)
+    sentence_count = len(_SENTENCE_RE.findall(text))
+    paragraph_count = sum(1 for p in text.split('\n\n') if p.strip())
     
-    # Palabras más frecuentes
-    words = re.findall(r'\b\w+\b', text.lower())
-    word_freq = {}
-    for word in words:
-        word_freq[word] = word_freq.get(word, 0) + 1
+    # Frecuencia de letras: Counter cuenta todos los caracteres en C y luego
+    # se filtran solo las claves distintas (incluye letras acentuadas como á, ñ)
+    char_freq = Counter(text.lower())
+    letter_freq = {char: count for char, count in char_freq.items() if char.isalpha()}
     
-    top_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)[:10]
+    # Palabras más frecuentes (reutiliza la lista de palabras ya extraída)
+    word_freq = Counter(map(str.lower, words))
+    top_words = word_freq.most_common(10)
     
     return {
         'characters': char_count,
@@ -237,6 +378,8 @@ def file_operations_example(file_path: str, data: Dict[str, any]) -> bool:
     """
     Prompt: Función que demuestra operaciones con archivos
     Debe escribir JSON, leer y validar el contenido
+    Usa orjson y recurre a json de la stdlib para lo que orjson no admite
+    o no conserva (enteros fuera de 64 bits, NaN/Infinity)
     """
     try:
         path = Path(file_path)
@@ -244,16 +387,18 @@ def file_operations_example(file_path: str, data: Dict[str, any]) -> bool:
         # Crear directorio si no existe
         path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Escribir datos a archivo JSON
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-        
-        # Leer y verificar
-        with open(path, 'r', encoding='utf-8') as f:
-            loaded_data = json.load(f)
+        # Escribir datos a archivo JSON (orjson genera bytes UTF-8 directamente),
+        # leer y validar que los datos son iguales
+        try:
+            path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            if orjson.loads(path.read_bytes()) == data:
+                return True
+        except orjson.JSONEncodeError:
+            pass
         
-        # Validar que los datos son iguales
-        return loaded_data == data
+        # Si orjson no puede escribirlo o pierde información, repetir con json de la stdlib
+        path.write_bytes(json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8'))
+        return json.loads(path.read_bytes()) == data
         
     except (IOError, json.JSONDecodeError) as e:
         print(f"Error en operaciones de archivo: {e}")
@@ -13,7 +13,6 @@ from pathlib import Path
 try:
     import tensorflow as tf
     from tensorflow.keras import layers, models, optimizers, callbacks
-    from tensorflow.keras.preprocessing.image import ImageDataGenerator
     from sklearn.model_selection import train_test_split
     from sklearn.preprocessing import StandardScaler, LabelEncoder
     print(f"TensorFlow version: {tf.__version__}")
@@ -22,6 +21,10 @@ except ImportError as e:
     print("Install with: pip install tensorflow scikit-learn matplotlib pandas")
     exit(1)
 
+# Precisión mixta: usa tensor cores en GPU (en CPU float16 sería más lento)
+if tf.config.list_physical_devices('GPU'):
+    tf.keras.mixed_precision.set_global_policy('mixed_float16')
+
 
 class SimpleNeuralNetwork:
     """
@@ -65,8 +68,8 @@ class SimpleNeuralNetwork:
             model.add(layers.Dense(neurons, activation=self.activation))
             model.add(layers.Dropout(0.2))
         
-        # Capa de salida
-        model.add(layers.Dense(self.output_dim, activation=self.output_activation))
+        # Capa de salida (en float32 para estabilidad numérica con precisión mixta)
+        model.add(layers.Dense(self.output_dim, activation=self.output_activation, dtype='float32'))
         
         self.model = model
         return model
@@ -166,22 +169,30 @@ class SimpleNeuralNetwork:
         if self.history is None:
             raise ValueError("No hay historial de entrenamiento disponible")
         
+        # Convertir cada métrica a array una sola vez para que matplotlib no recorra listas
+        history = {key: np.asarray(values, dtype=np.float32)
+                   for key, values in self.history.history.items()}
+        n_epochs = len(history['loss'])
+        
         fig, (ax1, ax2) = plt.subplots(1, 2, figsize=figsize)
         
         # Pérdida
-        ax1.plot(self.history.history['loss'], label='Training Loss')
-        if 'val_loss' in self.history.history:
-            ax1.plot(self.history.history['val_loss'], label='Validation Loss')
+        ax1.plot(history['loss'], label='Training Loss')
+        if 'val_loss' in history:
+            ax1.plot(history['val_loss'], label='Validation Loss')
+        # Límite X fijo: evita recalcularlo a partir de los datos
+        ax1.set_xlim(0, max(n_epochs - 1, 1))
         ax1.set_title('Model Loss')
         ax1.set_xlabel('Epoch')
         ax1.set_ylabel('Loss')
         ax1.legend()
         
         # Accuracy
-        if 'accuracy' in self.history.history:
-            ax2.plot(self.history.history['accuracy'], label='Training Accuracy')
-            if 'val_accuracy' in self.history.history:
-                ax2.plot(self.history.history['val_accuracy'], label='Validation Accuracy')
+        if 'accuracy' in history:
+            ax2.plot(history['accuracy'], label='Training Accuracy')
+            if 'val_accuracy' in history:
+                ax2.plot(history['val_accuracy'], label='Validation Accuracy')
+            ax2.set_xlim(0, max(n_epochs - 1, 1))
             ax2.set_title('Model Accuracy')
             ax2.set_xlabel('Epoch')
             ax2.set_ylabel('Accuracy')
@@ -219,6 +230,9 @@ class ImageClassifier:
         self.use_transfer_learning = use_transfer_learning
         self.model = None
         self.history = None
+        # Parámetros de carga de imágenes calculados una sola vez
+        self._target_size = input_shape[:2]
+        self._class_mode = 'binary' if num_classes == 2 else 'categorical'
         
     def build_cnn_model(self) -> tf.keras.Model:
         """Construye una CNN desde cero"""
@@ -234,7 +248,8 @@ class ImageClassifier:
             layers.Flatten(),
             layers.Dropout(0.5),
             layers.Dense(512, activation='relu'),
-            layers.Dense(self.num_classes, activation='softmax' if self.num_classes > 2 else 'sigmoid')
+            layers.Dense(self.num_classes, activation='softmax' if self.num_classes > 2 else 'sigmoid',
+                         dtype='float32')
         ])
         
         return model
@@ -260,7 +275,8 @@ class ImageClassifier:
             layers.GlobalAveragePooling2D(),
             layers.Dropout(0.2),
             layers.Dense(128, activation='relu'),
-            layers.Dense(self.num_classes, activation='softmax' if self.num_classes > 2 else 'sigmoid')
+            layers.Dense(self.num_classes, activation='softmax' if self.num_classes > 2 else 'sigmoid',
+                         dtype='float32')
         ])
         
         return model
@@ -284,48 +300,61 @@ class ImageClassifier:
         else:
             loss = 'binary_crossentropy'
         
+        adam = optimizers.Adam(learning_rate=learning_rate)
+        # Con float16 se escala la pérdida para evitar underflow en los gradientes
+        if tf.keras.mixed_precision.global_policy().compute_dtype == 'float16':
+            adam = tf.keras.mixed_precision.LossScaleOptimizer(adam)
+        
         self.model.compile(
-            optimizer=optimizers.Adam(learning_rate=learning_rate),
+            optimizer=adam,
             loss=loss,
             metrics=['accuracy']
         )
     
     def create_data_generators(self, train_dir: str, validation_dir: str = None, 
-                              batch_size: int = 32) -> Tuple[ImageDataGenerator, ...]:
-        """Crea generadores de datos con augmentación"""
-        # Generador para entrenamiento con augmentación
-        train_datagen = ImageDataGenerator(
-            rescale=1./255,
-            rotation_range=20,
-            width_shift_range=0.2,
-            height_shift_range=0.2,
-            shear_range=0.2,
-            zoom_range=0.2,
-            horizontal_flip=True,
-            fill_mode='nearest'
-        )
+                              batch_size: int = 32) -> Tuple[tf.data.Dataset, ...]:
+        """
+        Crea pipelines tf.data con augmentación
+        La augmentación se ejecuta como ops de TensorFlow en paralelo en la CPU
+        (dentro de Dataset.map) y la carga se solapa con el entrenamiento mediante prefetch
+        """
+        # Augmentación para entrenamiento con capas de preprocesamiento de Keras
+        augmentation = models.Sequential([
+            layers.Rescaling(1./255),
+            layers.RandomRotation(20 / 360, fill_mode='nearest'),
+            layers.RandomTranslation(0.2, 0.2, fill_mode='nearest'),
+            layers.RandomZoom(0.2, fill_mode='nearest'),
+            layers.RandomFlip('horizontal')
+        ])
         
-        # Generador para validación (solo rescaling)
-        validation_datagen = ImageDataGenerator(rescale=1./255)
+        # Validación: solo rescaling
+        rescale = layers.Rescaling(1./255)
         
-        # Generadores de datos
-        train_generator = train_datagen.flow_from_directory(
+        # Pipelines de datos
+        train_dataset = tf.keras.utils.image_dataset_from_directory(
             train_dir,
-            target_size=self.input_shape[:2],
+            image_size=self._target_size,
             batch_size=batch_size,
-            class_mode='binary' if self.num_classes == 2 else 'categorical'
-        )
+            label_mode=self._class_mode
+        ).map(
+            lambda images, labels: (augmentation(images, training=True), labels),
+            num_parallel_calls=tf.data.AUTOTUNE
+        ).prefetch(tf.data.AUTOTUNE)
         
-        validation_generator = None
+        validation_dataset = None
         if validation_dir:
-            validation_generator = validation_datagen.flow_from_directory(
+            validation_dataset = tf.keras.utils.image_dataset_from_directory(
                 validation_dir,
-                target_size=self.input_shape[:2],
+                image_size=self._target_size,
                 batch_size=batch_size,
-                class_mode='binary' if self.num_classes == 2 else 'categorical'
-            )
-        
-        return train_generator, validation_generator
+                label_mode=self._class_mode,
+                shuffle=False
+            ).map(
+                lambda images, labels: (rescale(images), labels),
+                num_parallel_calls=tf.data.AUTOTUNE
+            ).prefetch(tf.data.AUTOTUNE)
+        
+        return train_dataset, validation_dataset
 
 
 def create_sample_dataset(n_samples: int = 1000, n_features: int = 20, 
@@ -334,25 +363,25 @@ def create_sample_dataset(n_samples: int = 1000, n_features: int = 20,
     Prompt: Función que crea un dataset sintético para demostración
     Debe generar datos con ruido y diferentes patrones por clase
     """
-    np.random.seed(42)
+    # Generador local reproducible en lugar del estado global de np.random
+    rng = np.random.default_rng(42)
     
-    X = np.random.randn(n_samples, n_features)
+    X = rng.standard_normal((n_samples, n_features))
     
     # Crear patrones diferentes para cada clase
     if n_classes == 2:
         # Clase 0: valores más negativos en primeras características
         # Clase 1: valores más positivos en primeras características
-        y = np.zeros(n_samples)
-        for i in range(n_samples):
-            score = np.sum(X[i, :n_features//2]) - np.sum(X[i, n_features//2:])
-            y[i] = 1 if score > 0 else 0
+        # Todas las puntuaciones se calculan de una vez con reducciones por fila
+        scores = X[:, :n_features//2].sum(axis=1) - X[:, n_features//2:].sum(axis=1)
+        y = (scores > 0).astype(np.float64)
     else:
         # Múltiples clases basadas en diferentes regiones
-        y = np.random.randint(0, n_classes, n_samples)
+        y = rng.integers(0, n_classes, n_samples)
     
     # Añadir ruido
-    noise_mask = np.random.random(n_samples) < noise
-    y[noise_mask] = np.random.randint(0, n_classes, np.sum(noise_mask))
+    noise_mask = rng.random(n_samples) < noise
+    y[noise_mask] = rng.integers(0, n_classes, np.sum(noise_mask))
     
     return X, y
 